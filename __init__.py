@@ -1,2 +1,2 @@
-from django_fsm.fsm_field import FSMField, ONE_OF
+from django_fsm.fsm_field import FSMField, ONE_OF, TransitionNotAllowed
 from django_fsm.fsm_transition import transition
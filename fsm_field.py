@@ -1,4 +1,5 @@
-from inspect import isfunction, ismethod, getmembers
+import sys
+
 from django.db import models
 from django.db.models.signals import class_prepared
 from django.dispatch import Signal
@@ -17,18 +18,24 @@ class ONE_OF(object):
 	"""
 	Accepts of a list of allowed destinations
 	"""
+	__slots__ = ('allowed_states', '_allowed_set')
+
 	def __init__(self, *allowed_states):
 		if len(allowed_states) == 0:
 			raise ValueError('ONE_OF() must receive at least one destination.')
-		if type(allowed_states[0]) is str:
+		if isinstance(allowed_states[0], str):
 			# args contains multiple strings
 			self.allowed_states = allowed_states
-		elif type(allowed_states[0]) in [list, tuple]:
+		elif isinstance(allowed_states[0], (list, tuple)):
 			# args is a list of strings
 			self.allowed_states = tuple(allowed_states[0])
+		else:
+			raise ValueError('ONE_OF() accepts strings or a list of strings.')
+		# hashed membership for `get_state`, the tuple is kept for the message
+		self._allowed_set = frozenset(self.allowed_states)
 
 	def get_state(self, result):
-		if result not in self.allowed_states:
+		if result not in self._allowed_set:
 			raise TransitionNotAllowed(
 				f'{result} is not in list of allowed states\n{self.allowed_states}')
 		return result
@@ -41,22 +48,40 @@ class FSMFieldDescriptor(object):
 
 	https://docs.python.org/3/howto/descriptor.html
 	"""
+	__slots__ = ('field', 'private_field_name', '_readonly')
+
 	def __init__(self, field):
 		self.field = field
-		self.private_field_name = f'__fsm_{field.name}'
+		self.private_field_name = field._priv_name
+		self._readonly = field.readonly
 
 	def __get__(self, model, objtype=None):
 		if model is None:
 			# None when the attribute is accessed through the class (type(model))
 			# return the descriptor itself
 			return self
-		return getattr(model, self.private_field_name)
+		try:
+			return model.__dict__[self.private_field_name]
+		except KeyError:
+			raise AttributeError(f"'{type(model).__name__}' object has no attribute "
+			                     f"'{self.private_field_name}'") from None
 
 	def __set__(self, model, value):
-		if self.field.readonly and hasattr(model, self.private_field_name):
+		d = model.__dict__
+		if self._readonly and self.private_field_name in d:
 			raise AttributeError(f"Field {self.field.name} is set to `readonly` "
 			                     f"and thus direct modification is not allowed")
-		setattr(model, self.private_field_name, value)
+		d[self.private_field_name] = value
+
+
+class _WritableFSMDescriptor(FSMFieldDescriptor):
+	"""
+	Descriptor of a field that is not ``readonly``, skips the readonly guard.
+	"""
+	__slots__ = ()
+
+	def __set__(self, model, value):
+		model.__dict__[self.private_field_name] = value
 
 
 class FSMField(models.CharField):
@@ -68,6 +93,8 @@ class FSMField(models.CharField):
 	def __init__(self, readonly=True, max_length=60, *args, **kwargs):
 		self.readonly = readonly
 		self.parent_cls = None
+		self._priv_name = None
+		self._bound = False
 		super().__init__(max_length=max_length, *args, **kwargs)
 
 	def deconstruct(self):
@@ -87,7 +114,11 @@ class FSMField(models.CharField):
 
 		:param model: instance of model that owns the field
 		"""
-		return getattr(model, f'__fsm_{self.name}')
+		try:
+			return model.__dict__[self._priv_name]
+		except KeyError:
+			raise AttributeError(f"'{type(model).__name__}' object has no attribute "
+			                     f"'{self._priv_name}'") from None
 
 	def set_state(self, model, state):
 		"""
@@ -96,9 +127,11 @@ class FSMField(models.CharField):
 		:param model: instance of model that owns the field
 		:param state: str: desired state
 		"""
-		setattr(model, f'__fsm_{self.name}', state)
+		if type(state) is str:
+			state = sys.intern(state)
+		model.__dict__[self._priv_name] = state
 
-	def change_state(self, method_owner, method, *args, **kwargs):
+	def change_state(self, method_owner, method, fsm_tag, method_name, *args, **kwargs):
 		"""
 		Method used to drive the @transition decorated method.
 
@@ -110,59 +143,75 @@ class FSMField(models.CharField):
 			next state if the destination has multiple possible targets or
 			NoReturn otherwise.
 
+		:param fsm_tag: FSMTag: the `_fsm_tag` of the decorated method
+
+		:param method_name: str: name of the decorated method
+
 		:param args: @transition decorated method args
 
 		:param kwargs: @transition decorated method kwargs
 
 		:return: the result of the @transition decorated method
 		"""
-		fsm_tag = method._fsm_tag
-		method_name = method.__name__
 		current_state = self.get_state(method_owner)
 
-		if not fsm_tag.has_transition(current_state):
+		# Resolve the transition once and derive everything from it
+		tr = fsm_tag.get_transition(current_state)
+		if tr is None or (
+				tr.source == '+' and tr.destination == current_state):
 			raise TransitionNotAllowed(
 				f"Can't switch from state '{current_state}' using method "
 				f"'{method_name}'")
-		if not fsm_tag.conditions_met(method_owner, current_state):
+		conditions = tr.conditions
+		if conditions and not all(c(method_owner) for c in conditions):
 			raise TransitionNotAllowed(
 				f"Transition conditions have not been met for method "
 				f"'{method_name}'")
 
-		next_state = fsm_tag.next_state(current_state)
+		next_state = tr.destination
+		exception_state = tr.on_error
 
-		signal_kwargs = {
-			'sender': method_owner.__class__,
-			'instance': method_owner,
-			'name': method_name,
-			'field': fsm_tag.field,
-			'source': current_state,
-			'destination': next_state,
-			'exception': None,
-			'method_args': args,
-			'method_kwargs': kwargs
-		}
+		sender_cls = method_owner.__class__
+		send = transition.has_listeners(sender_cls)
 
 		try:
 			result = method(method_owner, *args, **kwargs)  # method(self, *args, **kwargs)
 			if next_state is not None:
 				if isinstance(next_state, ONE_OF):
 					next_state = next_state.get_state(result)
-					signal_kwargs['destination'] = next_state
 				self.set_state(method_owner, next_state)
 		except Exception as exc:
-			exception_state = fsm_tag.exception_state(current_state)
 			if exception_state:
 				self.set_state(method_owner, exception_state)
-				signal_kwargs['destination'] = exception_state
-				signal_kwargs['exception'] = exc
-				transition.send(**signal_kwargs)
+				if send:
+					self._send_transition(method, sender_cls, method_owner, current_state,
+					                      exception_state, exc, args, kwargs)
 			raise
 		else:
-			transition.send(**signal_kwargs)
+			if send:
+				self._send_transition(method, sender_cls, method_owner, current_state,
+				                      next_state, None, args, kwargs)
 
 		return result
 
+	@staticmethod
+	def _send_transition(method, sender, instance, source, destination, exception,
+	                     method_args, method_kwargs):
+		"""
+		Dispatch the `transition` signal of a completed (or failed) transition.
+		"""
+		signal_kwargs = method._fsm_signal_base.copy()
+		signal_kwargs.update(
+			sender=sender,
+			instance=instance,
+			source=source,
+			destination=destination,
+			exception=exception,
+			method_args=method_args,
+			method_kwargs=method_kwargs
+		)
+		transition.send(**signal_kwargs)
+
 	def contribute_to_class(self, cls, name, private_only=False):
 		"""
 		ModelBase class calls this method during model construction that we can
@@ -174,9 +223,16 @@ class FSMField(models.CharField):
 		:param name: state field name
 		"""
 		super().contribute_to_class(cls, name, private_only)
-		setattr(cls, name, FSMFieldDescriptor(self))
+		self._priv_name = f'__fsm_{name}'
+		if self.readonly:
+			descriptor = FSMFieldDescriptor(self)
+		else:
+			descriptor = _WritableFSMDescriptor(self)
+		setattr(cls, name, descriptor)
 
 		self.parent_cls = cls
+		# fields copied from an abstract parent carry over its `_bound` flag
+		self._bound = False
 		class_prepared.connect(self.assign_field_to_tag)
 
 	def assign_field_to_tag(self, sender, **kwargs):
@@ -185,12 +241,24 @@ class FSMField(models.CharField):
 		with a `field` attribute. In the event that the `field` is left as a string,
 		this method will replace it with the `field` object instead.
 		"""
-		if self.parent_cls is None or not issubclass(sender, self.parent_cls):
+		if self._bound or self.parent_cls is None or not issubclass(sender, self.parent_cls):
 			return
 
-		for _, value in getmembers(sender):
-			if (ismethod(value) or isfunction(value)) and hasattr(value, '_fsm_tag'):
-				if value._fsm_tag.field == self.name:
+		# Walk the class dicts directly rather than `getmembers` which would
+		# `getattr` every attribute and trigger descriptor side effects.
+		seen = set()
+		for klass in sender.__mro__:
+			for name, value in klass.__dict__.items():
+				if name in seen:
+					continue
+				seen.add(name)
+				tag = getattr(value, '_fsm_tag', None)
+				if tag is not None and (tag.field is self or tag.field == self.name):
 					# Assign the field object if the sender is the field's owner
 					# and the field name is this field's name.
-					value._fsm_tag.field = self
+					tag.field = self
+					value._fsm_signal_base['field'] = self
+
+		# The owner has been prepared, stop listening for every other model
+		class_prepared.disconnect(self.assign_field_to_tag)
+		self._bound = True
@@ -1,10 +1,11 @@
+import sys
+from collections import Counter, namedtuple
 from functools import wraps
 
+from django_fsm.fsm_field import TransitionNotAllowed
 
-class TransitionNotAllowed(Exception):
-	"""
-	Raised when a transition is not allowed
-	"""
+
+Transition = namedtuple('Transition', 'source destination on_error conditions custom')
 
 
 class FSMTag(object):
@@ -13,9 +14,12 @@ class FSMTag(object):
 	tag identifies the method as a transition method and it holds a reference to
 	the field that holds the state and the transitions.
 	"""
+	__slots__ = ('field', 'transitions', '_has_cache')
+
 	def __init__(self, field):
 		self.field = field  # field that holds the state and state_change method
-		self.transitions = {}  # dict{ source : dict{ membr.name: membr.value } }
+		self.transitions = {}  # dict{ source : Transition }
+		self._has_cache = {}  # dict{ state : bool } memoized `has_transition`
 
 	def get_transition(self, source):
 		"""
@@ -30,43 +34,58 @@ class FSMTag(object):
 			transition = self.transitions.get('+', None)
 		return transition
 
-	def add_transition(self, source, destination, on_error=None, conditions=[], custom={}):
+	def add_transition(self, source, destination, on_error=None, conditions=None, custom=None):
 		"""
-		Append a dictionary to `self.transitions` with the source's transition
-		information. A dictionary is created for each source.
+		Add a `Transition` for every given source to `self.transitions`. All
+		sources are validated before any of them is added so a failure leaves
+		the tag untouched.
 
-		:param source: str: source of allowed transitions
+		:param source: U(str, iterable[str]): source or sources of allowed
+			transitions
 		:param destination: str: destination of allowed transitions
 		:param on_error: func: callback to run upon error
 		:param conditions: list[func]: tests that need to pass to transition
 		:param custom: Not yet used
 		:return:
 		"""
-		if source in self.transitions:
-			raise AssertionError('Duplicate transition for {0} state'.format(source))
-
-		self.transitions[source] = {
-			'source': source,
-			'destination': destination,
-			'on_error': on_error,
-			'conditions': conditions,
-			'custom': custom
-		}
+		sources = [source] if isinstance(source, str) else source
+		# interned states let the dict lookups in `get_transition` hit the
+		# identity fast path, str subclasses (eg: TextChoices) can't be interned
+		sources = [sys.intern(s) if type(s) is str else s for s in sources]
+		if type(destination) is str:
+			destination = sys.intern(destination)
+		counts = Counter(sources)
+		duplicates = [s for s, n in counts.items() if n > 1]
+		if duplicates:
+			raise AssertionError('Duplicate transition for {0} state'.format(duplicates[0]))
+		if not self.transitions.keys().isdisjoint(counts):
+			duplicate = next(s for s in sources if s in self.transitions)
+			raise AssertionError('Duplicate transition for {0} state'.format(duplicate))
+
+		conditions = () if conditions is None else tuple(conditions)
+		custom = {} if custom is None else custom
+		self.transitions.update({
+			s: Transition(s, destination, on_error, conditions, custom)
+			for s in sources
+		})
+		self._has_cache.clear()
 
 	def has_transition(self, state):
 		"""
 		Check if the given state has a transition to make.
 		"""
-		if state in self.transitions:
-			return True
+		cache = self._has_cache
+		if state in cache:
+			return cache[state]
 
-		if '*' in self.transitions:
-			return True
-
-		if '+' in self.transitions and self.transitions['+'].target != state:
-			return True
-
-		return False
+		transitions = self.transitions
+		if state in transitions or '*' in transitions:
+			result = True
+		else:
+			transition = transitions.get('+', None)
+			result = transition is not None and transition.destination != state
+		cache[state] = result
+		return result
 
 	def conditions_met(self, method_owner, state):
 		"""
@@ -80,10 +99,10 @@ class FSMTag(object):
 
 		if transition is None:
 			return False
-		elif transition['conditions'] is None:
+		elif not transition.conditions:
 			return True
 		else:
-			return all(map(lambda condition: condition(method_owner), transition['conditions']))
+			return all(condition(method_owner) for condition in transition.conditions)
 
 	def next_state(self, current_state):
 		transition = self.get_transition(current_state)
@@ -91,7 +110,7 @@ class FSMTag(object):
 		if transition is None:
 			raise TransitionNotAllowed('No transition from {0}'.format(current_state))
 
-		return transition['destination']
+		return transition.destination
 
 	def exception_state(self, current_state):
 		transition = self.get_transition(current_state)
@@ -99,10 +118,10 @@ class FSMTag(object):
 		if transition is None:
 			raise TransitionNotAllowed('No transition from {0}'.format(current_state))
 
-		return transition['on_error']
+		return transition.on_error
 
 
-def transition(src='*', dest=None, field='state', on_error=None, conditions=[], custom={}):
+def transition(src='*', dest=None, field='state', on_error=None, conditions=None, custom=None):
 	"""
 	Tag the function with an `_fsm_tag` attribute which will be used to identify
 	the function as a transition function.
@@ -138,16 +157,32 @@ def transition(src='*', dest=None, field='state', on_error=None, conditions=[],
 	def internal_method(method):
 		fsm_tag = FSMTag(field=field)
 		setattr(method, '_fsm_tag', fsm_tag)
+		# static part of the `transition` signal kwargs, `field` is refreshed
+		# once the field name has been resolved to the field object
+		setattr(method, '_fsm_signal_base', {
+			'name': method.__name__,
+			'field': fsm_tag.field,
+		})
 
-		if isinstance(src, (list, tuple, set)):
-			for state in src:
-				method._fsm_tag.add_transition(state, dest, on_error, conditions, custom)
-		else:
-			method._fsm_tag.add_transition(src, dest, on_error, conditions, custom)
+		sources = src if isinstance(src, (list, tuple, set)) else (src,)
+		fsm_tag.add_transition(sources, dest, on_error, conditions, custom)
+
+		# `fsm_tag.field.change_state` bound on first call, the field no longer
+		# changes once the model has been prepared
+		_bound = [None]
+		method_name = method.__name__
 
 		@wraps(method)
 		def _change_state(method_owner, *args, **kwargs):
-			return fsm_tag.field.change_state(method_owner, method, *args, **kwargs)
+			fn = _bound[0]
+			if fn is None:
+				if isinstance(fsm_tag.field, str):
+					# Transition declared on a subclass prepared after the field's
+					# owner was bound, resolve the field by name.
+					fsm_tag.field = method_owner._meta.get_field(fsm_tag.field)
+					method._fsm_signal_base['field'] = fsm_tag.field
+				fn = _bound[0] = fsm_tag.field.change_state
+			return fn(method_owner, method, fsm_tag, method_name, *args, **kwargs)
 
 		return _change_state
 